@@ -1,48 +1,251 @@
 import os
+import json
+import random
+import hashlib
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+import asyncio
 from dotenv import load_dotenv
 import pandas as pd
-from datetime import datetime, timedelta
-from orb import Orb
+import httpx
+import orjson
+import orb
+from orb import AsyncOrb
 
 # Load environment variables
 load_dotenv()
 
-def create_backfill(orb_client, events):
+logger = logging.getLogger("orb_ingest")
+
+# Orb accepts at most 500 events per ingest request
+BATCH_SIZE = 500
+
+# Maximum number of customer creation requests in flight at once
+CUSTOMER_CONCURRENCY = 25
+
+# Maximum number of event batches in flight at once
+INGEST_CONCURRENCY = 8
+
+# Size of the HTTP connection pool shared by all Orb requests. Requests are
+# multiplexed over HTTP/2, but the pool is sized for the highest concurrency so
+# nothing queues if the connection falls back to HTTP/1.1.
+MAX_CONNECTIONS = max(CUSTOMER_CONCURRENCY, INGEST_CONCURRENCY)
+
+# Timeout in seconds for each Orb request
+REQUEST_TIMEOUT = 30.0
+
+# JSON file mapping account_id to Orb customer ID per API key, kept between runs
+CUSTOMER_CACHE_PATH = "customer_cache.json"
+
+# Number of CSV rows read and processed at a time
+CHUNK_SIZE = 50_000
+
+# Columns read from the CSV file. Low-cardinality text columns are stored as
+# categories; numeric columns are parsed as text and converted to float64 when cleaned.
+CSV_DTYPES = {
+    "account_id": "string",
+    "month": "string",
+    "transaction_id": "string",
+    "account_type": "category",
+    "bank_id": "category",
+    "standard": "string",
+    "sameday": "string",
+    "customer_id": "string",
+}
+
+# CSV columns sent to Orb as event properties
+PROPERTY_COLUMNS = ["account_id", "month", "transaction_id", "account_type", "bank_id", "standard", "sameday"]
+
+# Number of skipped row numbers included in the skipped-events warning
+SKIPPED_ROWS_LOGGED = 10
+
+# HTTP status codes that indicate a transient failure worth retrying
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+async def _with_retry(coro_factory, attempts=3, base=1.0):
+    """
+    Await an Orb API call, retrying transient failures with exponential backoff.
+
+    Parameters:
+        coro_factory (callable): Zero-argument callable returning a fresh awaitable for each attempt.
+        attempts (int): Maximum number of attempts before giving up.
+        base (float): Initial backoff delay in seconds, doubled after each failure.
+
+    Returns:
+        The result of the awaited call.
+    """
+    for attempt in range(attempts):
+        try:
+            return await coro_factory()
+        except orb.APIStatusError as e:
+            if e.status_code not in RETRYABLE_STATUS_CODES or attempt == attempts - 1:
+                raise
+            delay = base * 2 ** attempt + random.random() * 0.1
+            logger.warning("Orb API returned %d, retrying in %.1fs (attempt %d/%d)", e.status_code, delay, attempt + 1, attempts)
+            await asyncio.sleep(delay)
+        except orb.APIConnectionError as e:
+            if attempt == attempts - 1:
+                raise
+            delay = base * 2 ** attempt + random.random() * 0.1
+            logger.warning("Orb API connection failed (%s), retrying in %.1fs (attempt %d/%d)", e, delay, attempt + 1, attempts)
+            await asyncio.sleep(delay)
+
+class OrjsonAsyncClient(httpx.AsyncClient):
+    """
+    httpx client that serializes JSON request bodies with orjson.
+
+    The Orb SDK passes request bodies to `build_request` as `json=`, which httpx
+    encodes with the standard library `json` module. Large event batches spend
+    most of their client-side CPU time there, so encode them with orjson instead.
+
+    This relies on orb-billing releases before 4.51; from 4.51 the SDK serializes the
+    body itself and passes it as `content=`, in which case a warning is logged once
+    and the SDK's encoding is used unchanged.
+    """
+
+    _warned_bypassed = False
+
+    def build_request(self, method, url, *, json=None, content=None, headers=None, **kwargs):
+        if json is not None and content is None:
+            content = orjson.dumps(json)
+            headers = httpx.Headers(headers)
+            headers.setdefault("Content-Type", "application/json")
+            json = None
+        elif content is not None and not self._warned_bypassed:
+            OrjsonAsyncClient._warned_bypassed = True
+            logger.warning(
+                "Orb SDK %s sent a pre-serialized request body; orjson encoding is not in effect. "
+                "Install orb-billing<4.51 to use it.", orb.__version__
+            )
+        return super().build_request(method, url, json=json, content=content, headers=headers, **kwargs)
+
+def create_orb_client():
+    """
+    Create an Orb client backed by a single pooled HTTP/2 client.
+
+    Returns:
+        AsyncOrb: The Orb client instance. Close it with `await orb_client.close()` when done.
+    """
+    http_client = OrjsonAsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS),
+        timeout=httpx.Timeout(REQUEST_TIMEOUT),
+    )
+    # The SDK passes its own timeout on every request, so set it here as well.
+    # Retries are handled by _with_retry; the SDK's own retries would multiply them.
+    return AsyncOrb(
+        api_key=os.environ.get("ORB_API_KEY"),
+        http_client=http_client,
+        timeout=REQUEST_TIMEOUT,
+        max_retries=0,
+    )
+
+def _api_key_fingerprint(api_key):
+    """
+    Return a short, non-reversible identifier for an Orb API key.
+
+    Parameters:
+        api_key (str): The Orb API key, or None.
+
+    Returns:
+        str: The first 16 hex characters of the key's SHA-256 digest.
+    """
+    return hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+
+def _read_customer_cache_file(path):
+    """
+    Read every environment's customer cache from the JSON cache file.
+
+    Parameters:
+        path (str): Path to the JSON cache file.
+
+    Returns:
+        dict: Customer caches keyed by API key fingerprint, or an empty dict if no cache exists.
+    """
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error("Error loading customer cache, starting empty: %s", e)
+        return {}
+
+def load_customer_cache(api_key, path=CUSTOMER_CACHE_PATH):
+    """
+    Load the account_id to customer ID cache saved by a previous run with the same API key.
+
+    Customer IDs differ between Orb environments (e.g. test and live), so the cache
+    file keeps a separate section per API key fingerprint.
+
+    Parameters:
+        api_key (str): The Orb API key the run uses.
+        path (str): Path to the JSON cache file.
+
+    Returns:
+        dict: The cached customer IDs, or an empty dict if none are cached for this key.
+    """
+    return _read_customer_cache_file(path).get(_api_key_fingerprint(api_key), {})
+
+def save_customer_cache(customer_cache, api_key, path=CUSTOMER_CACHE_PATH):
+    """
+    Save the account_id to customer ID cache for the next run with the same API key.
+
+    Parameters:
+        customer_cache (dict): Cache of created customers.
+        api_key (str): The Orb API key the run uses.
+        path (str): Path to the JSON cache file.
+
+    Returns:
+        None
+    """
+    caches = _read_customer_cache_file(path)
+    caches[_api_key_fingerprint(api_key)] = customer_cache
+    try:
+        with open(path, "w") as f:
+            json.dump(caches, f, indent=2, sort_keys=True)
+    except OSError as e:
+        logger.error("Error saving customer cache: %s", e)
+
+async def create_backfill(orb_client, timeframe_start):
     """
     Create a backfill for historical events in Orb.
 
     Parameters:
-        orb_client (Orb): The Orb client instance.
-        events (list): List of event dictionaries to backfill.
+        orb_client (AsyncOrb): The Orb client instance.
+        timeframe_start (str): ISO 8601 timestamp of the earliest event to backfill.
 
     Returns:
         str: The backfill ID.
     """
     try:
-        timeframe_start = min(event["timestamp"] for event in events)
-        timeframe_end = (datetime.fromisoformat(timeframe_start.replace("Z", "")) + timedelta(days=9)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        timeframe_end = (pd.Timestamp(timeframe_start) + pd.Timedelta(days=9)).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        backfill = orb_client.events.backfills.create(
+        backfill = await _with_retry(lambda: orb_client.events.backfills.create(
             timeframe_start=timeframe_start,
             timeframe_end=timeframe_end,
             close_time=None,  # Optional close_time parameter
             replace_existing_events=True
-        )
+        ))
         backfill_id = backfill.id
-        print(f"Backfill created successfully with ID: {backfill_id}")
+        logger.info("Backfill created successfully with ID: %s", backfill_id)
         return backfill_id
     except Exception as e:
-        print(f"Error creating backfill: {e}")
+        logger.error("Error creating backfill: %s", e)
         return None
 
-def create_or_get_customer(orb_client, customer_data, customer_cache):
+async def create_or_get_customer(orb_client, customer_data, customer_cache, semaphore):
     """
     Create or fetch a customer in Orb and return the customer ID.
 
     Parameters:
-        orb_client (Orb): The Orb client instance.
+        orb_client (AsyncOrb): The Orb client instance.
         customer_data (dict): A dictionary containing customer attributes.
         customer_cache (dict): Cache of created customers to avoid duplicates.
+            Customers are created with their account_id as the external customer ID,
+            so one that already exists in Orb is fetched instead.
+        semaphore (asyncio.Semaphore): Limits concurrent requests to Orb.
 
     Returns:
         str: The customer ID.
@@ -52,110 +255,302 @@ def create_or_get_customer(orb_client, customer_data, customer_cache):
         return customer_cache[account_id]
 
     try:
-        customer = orb_client.customers.create(
-            email=customer_data.get("email", f"{customer_data['account_id']}@example.com"),
-            name=customer_data.get("name", f"Customer {customer_data['account_id']}"),
-        )
+        async with semaphore:
+            try:
+                customer = await _with_retry(lambda: orb_client.customers.create(
+                    email=customer_data.get("email", f"{customer_data['account_id']}@example.com"),
+                    name=customer_data.get("name", f"Customer {customer_data['account_id']}"),
+                    external_customer_id=account_id,
+                ))
+                action = "created"
+            except (orb.DuplicateResourceCreation, orb.ResourceConflict):
+                # The customer already exists in Orb from an earlier run
+                customer = await _with_retry(lambda: orb_client.customers.fetch_by_external_id(account_id))
+                action = "fetched"
         customer_cache[account_id] = customer.id
-        print(f"Customer created with ID: {customer.id}")
+        logger.debug("Customer %s with ID: %s", action, customer.id)
         return customer.id
     except Exception as e:
-        print(f"Error creating customer: {e}")
+        logger.error("Error creating customer: %s", e)
         return None
 
-def ingest_csv_to_orb(file_path):
+def find_timeframe_start(file_path):
+    """
+    Find the earliest event timestamp in a CSV file by streaming only its month column.
+
+    Parameters:
+        file_path (str): Path to the CSV file.
+
+    Returns:
+        str: ISO 8601 timestamp of the earliest valid month, or None if there is none.
+    """
+    months = set()
+    for chunk in pd.read_csv(file_path, chunksize=CHUNK_SIZE, usecols=["month"], dtype={"month": "string"}):
+        months.update(chunk["month"].dropna().unique())
+
+    timestamps = pd.to_datetime(list(months), format="%m-%Y", errors='coerce').dropna()
+    if timestamps.empty:
+        return None
+    return timestamps.min().strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def clean_chunk(data):
+    """
+    Clean a chunk of CSV rows and drop rows that cannot become valid events.
+
+    Parameters:
+        data (pd.DataFrame): A chunk of rows read from the CSV file. It is not modified.
+
+    Returns:
+        pd.DataFrame: The cleaned rows, with an added `iso_timestamp` column.
+    """
+    data = data.copy()
+
+    # Replace NaN and clean numeric fields
+    data["customer_id"] = data.get("customer_id", None)
+    # astype("string") is free when the column was read as a string, and lets numeric input through
+    for column in ("standard", "sameday"):
+        data[column] = pd.to_numeric(data[column].astype("string").str.replace(",", "", regex=False), errors='coerce').fillna(0.0).astype("float64")
+
+    # Convert month column to ISO 8601 format, parsing each distinct month only once
+    months = data["month"].dropna().unique()
+    iso_months = pd.to_datetime(months, format="%m-%Y", errors='coerce').strftime("%Y-%m-%dT%H:%M:%SZ")
+    data["iso_timestamp"] = data["month"].map(dict(zip(months, iso_months)))
+
+    # Drop rows that cannot become valid events, and duplicates of the same transaction
+    rows_before = len(data)
+    data = data.dropna(subset=["account_id", "transaction_id", "iso_timestamp"]).drop_duplicates(
+        subset=["account_id", "transaction_id", "month"]
+    )
+    if len(data) < rows_before:
+        logger.info("Dropped %d invalid or duplicate rows.", rows_before - len(data))
+    return data
+
+def build_events(data):
+    """
+    Build Orb event dictionaries from cleaned rows.
+
+    Parameters:
+        data (pd.DataFrame): Cleaned rows with `iso_timestamp` and `customer_id` columns.
+
+    Returns:
+        list: Event dictionaries ready for ingestion.
+    """
+    # Skip rows whose customer could not be created
+    missing_customer = data["customer_id"].isna()
+    if missing_customer.any():
+        skipped_rows = data.index[missing_customer][:SKIPPED_ROWS_LOGGED] + 1
+        logger.warning(
+            "Skipping %d events: Unable to create customer (rows %s%s).",
+            missing_customer.sum(),
+            ", ".join(map(str, skipped_rows)),
+            ", ..." if missing_customer.sum() > SKIPPED_ROWS_LOGGED else ""
+        )
+    valid = data.loc[~missing_customer]
+
+    # Derive idempotency keys from row content so re-running a reordered or appended CSV
+    # does not ingest duplicate events
+    row_keys = valid["account_id"].astype(str) + "|" + valid["transaction_id"].astype(str) + "|" + valid["month"].astype(str)
+    idempotency_keys = row_keys.map(lambda row_key: hashlib.blake2b(row_key.encode(), digest_size=16).hexdigest())
+
+    # Create an event for each remaining row in the DataFrame
+    records = valid[PROPERTY_COLUMNS + ["iso_timestamp", "customer_id"]].to_dict(orient="records")
+    return [
+        {
+            "event_name": "ingest_event",
+            "idempotency_key": idempotency_key,
+            "properties": {column: record[column] for column in PROPERTY_COLUMNS},
+            "timestamp": record["iso_timestamp"],  # ISO 8601 formatted date
+            "customer_id": record["customer_id"],
+        }
+        for idempotency_key, record in zip(idempotency_keys, records)
+    ]
+
+async def prepare_events(orb_client, data, customer_cache, semaphore):
+    """
+    Clean a chunk of CSV rows, create any missing customers, and build Orb events.
+
+    Parameters:
+        orb_client (AsyncOrb): The Orb client instance.
+        data (pd.DataFrame): A chunk of rows read from the CSV file.
+        customer_cache (dict): Cache of created customers shared across chunks.
+        semaphore (asyncio.Semaphore): Limits concurrent requests to Orb.
+
+    Returns:
+        list: Event dictionaries ready for ingestion.
+    """
+    data = clean_chunk(data)
+
+    # Create customers for every account without a customer_id concurrently
+    needed = [
+        account_id for account_id in data.loc[data["customer_id"].isna(), "account_id"].unique()
+        if account_id not in customer_cache
+    ]
+    customer_ids = await asyncio.gather(*(
+        create_or_get_customer(
+            orb_client,
+            {"account_id": account_id, "email": f"{account_id}@example.com"},
+            customer_cache,
+            semaphore
+        )
+        for account_id in needed
+    ))
+    if needed:
+        logger.info("Resolved %d of %d customers.", sum(1 for customer_id in customer_ids if customer_id), len(needed))
+    data = data.assign(customer_id=data["customer_id"].fillna(data["account_id"].map(customer_cache)))
+
+    return build_events(data)
+
+async def ingest_events(orb_client, events, backfill_id):
+    """
+    Submit events to Orb in batches of BATCH_SIZE, with up to INGEST_CONCURRENCY batches in flight.
+
+    Parameters:
+        orb_client (AsyncOrb): The Orb client instance.
+        events (list): Event dictionaries to ingest.
+        backfill_id (str): The backfill to attach events to, or None.
+
+    Returns:
+        int: The number of events in batches Orb accepted.
+    """
+    semaphore = asyncio.Semaphore(INGEST_CONCURRENCY)
+
+    async def submit(batch_number, batch_start):
+        batch = events[batch_start:batch_start + BATCH_SIZE]
+        try:
+            async with semaphore:
+                response = await _with_retry(
+                    lambda: orb_client.events.ingest(events=batch, debug=True, backfill_id=backfill_id)
+                )
+            logger.info("Batch %d: %d events OK", batch_number, len(batch))
+            logger.debug("Debug response: %s", response)
+            return len(batch)
+        except Exception as e:
+            logger.error("Error ingesting batch of %d events starting at event %d: %s", len(batch), batch_start + 1, e)
+            return 0
+
+    # Submit events in batches concurrently, with debug mode for ingestion
+    ingested_counts = await asyncio.gather(*(
+        submit(batch_number, batch_start)
+        for batch_number, batch_start in enumerate(range(0, len(events), BATCH_SIZE), start=1)
+    ))
+    return sum(ingested_counts)
+
+async def _ingest_csv_to_orb_async(file_path):
     """
     Ingest data from a CSV file into the Orb platform using the Orb SDK.
 
+    The file is streamed in chunks of CHUNK_SIZE rows so memory use stays
+    bounded and events are sent while the rest of the file is still being read.
+
     Parameters:
         file_path (str): Path to the CSV file.
 
     Returns:
         None
     """
+    orb_client = None
+    api_key = os.environ.get("ORB_API_KEY")
+    customer_cache = load_customer_cache(api_key)
     try:
-        # Initialize Orb client
-        orb_client = Orb(api_key=os.environ.get("ORB_API_KEY"))
+        # Initialize Orb client; its connection pool is reused by every request in the run
+        orb_client = create_orb_client()
 
-        # Read the CSV file into a Pandas DataFrame
-        data = pd.read_csv(file_path)
+        # Unsorted files can have their earliest month in any chunk, so find it up front
+        timeframe_start = find_timeframe_start(file_path)
 
-        print("Data Ingested from CSV Successfully!")
-        print(f"Rows: {data.shape[0]}, Columns: {data.shape[1]}")
-        print(data.head())
+        # Stream the CSV file into Pandas DataFrames of CHUNK_SIZE rows
+        chunks = pd.read_csv(
+            file_path,
+            chunksize=CHUNK_SIZE,
+            usecols=lambda column: column in CSV_DTYPES,
+            dtype=CSV_DTYPES,
+        )
 
-        # Replace NaN and clean numeric fields
-        data["customer_id"] = data.get("customer_id", None)
-        data["standard"] = data["standard"].replace({",": ""}, regex=True).astype(float, errors='ignore').fillna(0)
-        data["sameday"] = data["sameday"].replace({",": ""}, regex=True).astype(float, errors='ignore').fillna(0)
+        semaphore = asyncio.Semaphore(CUSTOMER_CONCURRENCY)
+        backfill_id = None
+        prepared_events = 0
+        ingested_events = 0
+        for chunk_number, data in enumerate(chunks, start=1):
+            logger.info("Chunk %d read from CSV: Rows: %d, Columns: %d", chunk_number, data.shape[0], data.shape[1])
 
-        # Convert month column to ISO 8601 format
-        data["iso_timestamp"] = pd.to_datetime(data["month"], format="%m-%Y", errors='coerce').dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+            events = await prepare_events(orb_client, data, customer_cache, semaphore)
+            if not events:
+                continue
 
-        customer_cache = {}
-        events = []
-        for index, row in data.iterrows():
-            try:
-                # Handle missing or invalid customer_id
-                customer_id = row.get("customer_id")
-                if not customer_id or pd.isna(customer_id):
-                    customer_id = create_or_get_customer(
-                        orb_client,
-                        {"account_id": row["account_id"], "email": f"{row['account_id']}@example.com"},
-                        customer_cache
-                    )
-                    if not customer_id:
-                        print(f"Skipping event {index + 1}: Unable to create customer.")
-                        continue
-
-                # Create an event for each row in the DataFrame
-                event_params = {
-                    "event_name": "ingest_event",
-                    "idempotency_key": f"event_{index}",
-                    "properties": {
-                        "account_id": row["account_id"],
-                        "month": row["month"],
-                        "transaction_id": row["transaction_id"],
-                        "account_type": row["account_type"],
-                        "bank_id": row["bank_id"],
-                        "standard": row["standard"],
-                        "sameday": row["sameday"],
-                    },
-                    "timestamp": row["iso_timestamp"],  # ISO 8601 formatted date
-                    "customer_id": customer_id,
-                }
-                events.append(event_params)
-
-            except Exception as e:
-                print(f"Error preparing event {index + 1}: {e}")
-
-        if events:
-            # Create a backfill for historical events
-            backfill_id = create_backfill(orb_client, events)
-            if backfill_id:
-                print(f"Backfill created with ID: {backfill_id}")
-
-            # Add debug mode for ingestion
-            try:
-                response = orb_client.events.ingest(events=events, debug=True, backfill_id=backfill_id)
-                print(f"Debug response: {response}")
-            except Exception as e:
-                print(f"Error ingesting events: {e}")
+            if prepared_events == 0:
+                # Create a backfill for historical events
+                backfill_id = await create_backfill(orb_client, timeframe_start)
+                if backfill_id:
+                    logger.info("Backfill created with ID: %s", backfill_id)
+
+            ingested_events += await ingest_events(orb_client, events, backfill_id)
+            prepared_events += len(events)
+
+        if not prepared_events:
+            logger.warning("No events were prepared for ingestion.")
+        elif ingested_events == prepared_events:
+            logger.info("Data Ingested from CSV Successfully! Events: %d", ingested_events)
         else:
-            print("No events were prepared for ingestion.")
+            logger.error(
+                "Ingested %d of %d events; %d failed.",
+                ingested_events, prepared_events, prepared_events - ingested_events
+            )
 
     except FileNotFoundError:
-        print(f"Error: The file at {file_path} was not found.")
+        logger.error("Error: The file at %s was not found.", file_path)
     except pd.errors.EmptyDataError:
-        print("Error: The file is empty.")
+        logger.error("Error: The file is empty.")
     except pd.errors.ParserError as e:
-        print(f"Error parsing the file: {e}")
+        logger.error("Error parsing the file: %s", e)
     except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+        logger.exception("An unexpected error occurred: %s", e)
+    finally:
+        save_customer_cache(customer_cache, api_key)
+        if orb_client is not None:
+            await orb_client.close()
+
+def configure_logging(level=logging.INFO):
+    """
+    Route log records through a queue so console output is written on a background thread.
+
+    Only the orb_ingest logger is set to `level`; other libraries (httpx, httpcore, h2)
+    keep the root logger's default of WARNING so they don't log every request.
+
+    Parameters:
+        level (int): Minimum level of orb_ingest records to emit.
+
+    Returns:
+        QueueListener: The started listener. Call `listener.stop()` to flush remaining records.
+    """
+    log_queue = queue.SimpleQueue()
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    listener = QueueListener(log_queue, console_handler)
+
+    logging.getLogger().addHandler(QueueHandler(log_queue))
+    logger.setLevel(level)
+    listener.start()
+    return listener
+
+def ingest_csv_to_orb(file_path):
+    """
+    Ingest data from a CSV file into the Orb platform using the Orb SDK.
+
+    Parameters:
+        file_path (str): Path to the CSV file.
+
+    Returns:
+        None
+    """
+    asyncio.run(_ingest_csv_to_orb_async(file_path))
 
 if __name__ == "__main__":
     # Specify the path to your CSV file
     csv_file_path = "Orb_sample_data.csv"
 
     # Run the ingestion function
-    ingest_csv_to_orb(csv_file_path)
+    log_listener = configure_logging()
+    try:
+        ingest_csv_to_orb(csv_file_path)
+    finally:
+        log_listener.stop()